@@ -3,7 +3,11 @@ data handler and mapping resources for straightforward access.
 """
 
 import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Generic, TypeVar
 
 from biocommons.seqrepo import SeqRepo
 
@@ -20,10 +24,76 @@ from cool_seq_tool.sources.uta_database import UTA_DB_URL, UtaDatabase
 
 _logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+class _Resource(Generic[_T]):
+    """Non-data descriptor for a ``CoolSeqTool`` resource that is loaded on first
+    access.
+
+    As with :py:class:`functools.cached_property`, assigning to the attribute
+    overrides the resource on that instance (e.g. via ``unittest.mock.patch.object``),
+    and deleting the override falls back to the loaded resource. Unlike it, first
+    access is locked, so concurrent callers load the resource only once.
+    """
+
+    def __init__(
+        self, load: Callable[["CoolSeqTool"], _T], data_sources: tuple[str, ...]
+    ) -> None:
+        """Initialize descriptor.
+
+        :param load: Method that constructs the resource
+        :param data_sources: Names of independent data sources that ``load`` uses
+        """
+        self._load = load
+        self._data_sources = data_sources
+        self.__doc__ = load.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Record the attribute name the resource is assigned to.
+
+        :param owner: Owning class
+        :param name: Attribute name
+        """
+        self._name = name
+
+    def __get__(
+        self, instance: "CoolSeqTool | None", owner: type | None = None
+    ) -> "_T | _Resource[_T]":
+        """Get the resource, loading it on first access.
+
+        :param instance: CoolSeqTool instance, or ``None`` if accessed on the class
+        :param owner: Owning class
+        :return: Resource instance, or the descriptor itself if accessed on the class
+        """
+        if instance is None:
+            return self
+        return instance._get_resource(  # noqa: SLF001
+            self._name, lambda: self._load(instance), self._data_sources
+        )
+
+
+def _resource(
+    *data_sources: str,
+) -> Callable[[Callable[["CoolSeqTool"], _T]], _Resource[_T]]:
+    """Declare a ``CoolSeqTool`` resource that is loaded on first access.
+
+    :param data_sources: Names of independent data sources that the resource uses.
+        Any that aren't loaded yet are loaded concurrently on its first access.
+    :return: Decorator that turns a loading method into a resource descriptor
+    """
+    return lambda load: _Resource(load, data_sources)
+
 
 class CoolSeqTool:
     """Non-redundantly initialize all Cool-Seq-Tool data resources, available under the
-    following attribute names:
+    following attribute names. Each resource is constructed on first access, so
+    resources that are never used are never loaded, and errors loading a resource
+    (e.g. missing data files) are raised on first access rather than by the
+    constructor. First access is thread-safe: concurrent callers share a single
+    instance of each resource. When a mapper is first accessed, the independent data
+    sources it uses are loaded concurrently. Assigning to an attribute replaces that
+    resource, including for mappers constructed afterwards:
 
     * ``self.seqrepo_access``: :py:class:`SeqRepoAccess <cool_seq_tool.handlers.seqrepo_access.SeqRepoAccess>`
     * ``self.transcript_mappings``: :py:class:`TranscriptMappings <cool_seq_tool.sources.transcript_mappings.TranscriptMappings>`
@@ -52,13 +122,15 @@ class CoolSeqTool:
         >>> cst = CoolSeqTool()
 
         By default, this will attempt to fetch the latest versions of static resources,
-        which means brief FTP and HTTPS requests to NCBI servers upon initialization.
-        To suppress this check and simply rely on the most recent locally-available
-        data:
+        which means brief FTP and HTTPS requests to NCBI servers when those resources
+        are first accessed. To suppress this check and simply rely on the most recent
+        locally-available data:
 
         >>> cst = CoolSeqTool(force_local_files=True)
 
-        Note that this will raise a FileNotFoundError if no locally-available data exists.
+        Note that constructing ``CoolSeqTool`` does not read any files, so a
+        FileNotFoundError is only raised once a resource that has no
+        locally-available data is first accessed.
 
         Paths to those files can also be explicitly passed to avoid checks as well:
 
@@ -81,30 +153,137 @@ class CoolSeqTool:
         :param force_local_files: if ``True``, don't check for or try to acquire latest
             versions of static data files -- just use most recently available, if any
         """
-        if not sr:
-            sr = SeqRepo(root_dir=SEQREPO_ROOT_DIR)
-        self.seqrepo_access = SeqRepoAccess(sr)
-        self.transcript_mappings = TranscriptMappings(
-            transcript_file_path=transcript_file_path,
-            lrg_refseqgene_path=lrg_refseqgene_path,
-            from_local=force_local_files,
+        self._transcript_file_path = transcript_file_path
+        self._lrg_refseqgene_path = lrg_refseqgene_path
+        self._mane_data_path = mane_data_path
+        self._db_url = db_url
+        self._sr = sr
+        self._force_local_files = force_local_files
+        self._resources: dict[str, object] = {}
+        self._resource_locks: dict[str, threading.Lock] = {}
+        self._resource_locks_lock = threading.Lock()
+
+    def _get_resource(
+        self, name: str, load: Callable[[], _T], data_sources: tuple[str, ...] = ()
+    ) -> _T:
+        """Get a resource, loading it on first access.
+
+        Loading is serialized per resource, so concurrent first accesses load it only
+        once, while different resources can still be loaded in parallel.
+
+        :param name: Resource attribute name
+        :param load: Callable that constructs the resource
+        :param data_sources: Names of independent data sources that ``load`` uses.
+            Any that aren't loaded yet are loaded concurrently before calling ``load``.
+        :return: Resource instance
+        """
+        if name in self._resources:
+            return self._resources[name]
+        with self._resource_locks_lock:
+            lock = self._resource_locks.setdefault(name, threading.Lock())
+        with lock:
+            if name not in self._resources:
+                self._load_concurrently(data_sources)
+                self._resources[name] = load()
+        return self._resources[name]
+
+    def _load_concurrently(self, names: tuple[str, ...]) -> None:
+        """Load data sources on a thread pool.
+
+        Data sources are independent of each other and mostly bound by file/network
+        I/O, so loading them together takes about as long as the slowest one.
+
+        :param names: Resource attribute names. Resources that are already loaded or
+            overridden are skipped.
+        """
+        names = [
+            name
+            for name in names
+            if name not in self._resources and name not in vars(self)
+        ]
+        if len(names) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            # consume results so that loading errors are raised here
+            list(executor.map(lambda name: getattr(self, name), names))
+
+    @_resource()
+    def seqrepo_access(self) -> SeqRepoAccess:
+        """Provide SeqRepo access, opening a new SeqRepo instance if none was given
+
+        :return: SeqRepoAccess instance
+        """
+        return SeqRepoAccess(self._sr or SeqRepo(root_dir=SEQREPO_ROOT_DIR))
+
+    @_resource()
+    def transcript_mappings(self) -> TranscriptMappings:
+        """Load transcript mappings data
+
+        :return: TranscriptMappings instance
+        """
+        return TranscriptMappings(
+            transcript_file_path=self._transcript_file_path,
+            lrg_refseqgene_path=self._lrg_refseqgene_path,
+            from_local=self._force_local_files,
         )
-        self.mane_transcript_mappings = ManeTranscriptMappings(
-            mane_data_path=mane_data_path, from_local=force_local_files
+
+    @_resource()
+    def mane_transcript_mappings(self) -> ManeTranscriptMappings:
+        """Load MANE summary data
+
+        :return: ManeTranscriptMappings instance
+        """
+        return ManeTranscriptMappings(
+            mane_data_path=self._mane_data_path, from_local=self._force_local_files
         )
-        self.uta_db = UtaDatabase(db_url=db_url)
-        self.alignment_mapper = AlignmentMapper(
+
+    @_resource()
+    def uta_db(self) -> UtaDatabase:
+        """Provide UTA database access
+
+        :return: UtaDatabase instance
+        """
+        return UtaDatabase(db_url=self._db_url)
+
+    @_resource("transcript_mappings", "uta_db")
+    def alignment_mapper(self) -> AlignmentMapper:
+        """Provide alignment mapper
+
+        :return: AlignmentMapper instance
+        """
+        return AlignmentMapper(
             self.seqrepo_access, self.transcript_mappings, self.uta_db
         )
-        self.liftover = LiftOver()
-        self.mane_transcript = ManeTranscript(
+
+    @_resource()
+    def liftover(self) -> LiftOver:
+        """Load liftover chain files
+
+        :return: LiftOver instance
+        """
+        return LiftOver()
+
+    @_resource("transcript_mappings", "mane_transcript_mappings", "uta_db", "liftover")
+    def mane_transcript(self) -> ManeTranscript:
+        """Provide MANE transcript mapper
+
+        :return: ManeTranscript instance
+        """
+        return ManeTranscript(
             self.seqrepo_access,
             self.transcript_mappings,
             self.mane_transcript_mappings,
             self.uta_db,
             self.liftover,
         )
-        self.ex_g_coords_mapper = ExonGenomicCoordsMapper(
+
+    @_resource("uta_db", "mane_transcript_mappings", "liftover")
+    def ex_g_coords_mapper(self) -> ExonGenomicCoordsMapper:
+        """Provide exon/genomic coordinates mapper
+
+        :return: ExonGenomicCoordsMapper instance
+        """
+        return ExonGenomicCoordsMapper(
             self.seqrepo_access,
             self.uta_db,
             self.mane_transcript_mappings,
@@ -6,6 +6,7 @@ import logging
 from os import environ
 from pathlib import Path
 
+from biocommons.seqrepo import SeqRepo
 from ga4gh.vrs.dataproxy import SeqRepoDataProxy
 
 from cool_seq_tool.schemas import Assembly, CoordinateType
@@ -16,6 +17,41 @@ _logger = logging.getLogger(__name__)
 
 SEQREPO_ROOT_DIR = environ.get("SEQREPO_ROOT_DIR", "/usr/local/share/seqrepo/latest")
 
+_REFSEQ_PREFIXES = (
+    "NC_",
+    "AC_",
+    "NZ_",
+    "NT_",
+    "NW_",
+    "NG_",
+    "NM_",
+    "XM_",
+    "NR_",
+    "XR_",
+    "NP_",
+    "AP_",
+    "XP_",
+    "YP_",
+    "WP_",
+)
+_ENSEMBL_PREFIXES = ("ENSE", "ENSFM", "ENSG", "ENSGT", "ENSP", "ENSR", "ENST")
+
+# Max number of chromosome <-> accession translations memoized per instance
+_TRANSLATION_CACHE_MAXSIZE = 256
+
+
+def _cache_translation(cache: dict, key: str, value: str | list[str]) -> None:
+    """Memoize a successful translation, evicting the oldest entry once the cache is
+    full.
+
+    :param cache: Translation cache
+    :param key: Translation input
+    :param value: Translation result
+    """
+    if len(cache) >= _TRANSLATION_CACHE_MAXSIZE:
+        cache.pop(next(iter(cache)), None)
+    cache[key] = value
+
 
 class SeqRepoAccess(SeqRepoDataProxy):
     """Provide a wrapper around the base SeqRepoDataProxy class from ``VRS-Python`` to
@@ -24,6 +60,18 @@ class SeqRepoAccess(SeqRepoDataProxy):
 
     environ["SEQREPO_LRU_CACHE_MAXSIZE"] = "none"
 
+    def __init__(self, sr: SeqRepo) -> None:
+        """Initialize SeqRepoAccess class.
+
+        :param sr: SeqRepo instance
+        """
+        super().__init__(sr)
+        # chromosome <-> accession translations are static for a given SeqRepo
+        # snapshot, so memoize them to avoid repeated alias database lookups. Failed
+        # lookups aren't memoized, so arbitrary input can't fill the cache
+        self._chromosome_to_acs_cache: dict[str, list[str]] = {}
+        self._ac_to_chromosome_cache: dict[str, str] = {}
+
     def get_reference_sequence(
         self,
         ac: str,
@@ -139,6 +187,23 @@ class SeqRepoAccess(SeqRepoDataProxy):
     def chromosome_to_acs(self, chromosome: str) -> tuple[list[str] | None, str | None]:
         """Get accessions for a chromosome
 
+        :param chromosome: Chromosome number. Must be either 1-22, X, or Y
+        :return: Accessions for chromosome (ordered by latest assembly)
+        """
+        acs = self._chromosome_to_acs_cache.get(chromosome)
+        if acs is None:
+            acs, warning = self._chromosome_to_acs(chromosome)
+            if not acs:
+                return acs, warning
+            _cache_translation(self._chromosome_to_acs_cache, chromosome, acs)
+        # copy so that callers can't modify the cached list
+        return acs.copy(), None
+
+    def _chromosome_to_acs(
+        self, chromosome: str
+    ) -> tuple[list[str] | None, str | None]:
+        """Look up accessions for a chromosome in SeqRepo
+
         :param chromosome: Chromosome number. Must be either 1-22, X, or Y
         :return: Accessions for chromosome (ordered by latest assembly)
         """
@@ -159,21 +224,28 @@ class SeqRepoAccess(SeqRepoDataProxy):
     def ac_to_chromosome(self, ac: str) -> tuple[str | None, str | None]:
         """Get chromosome for accession.
 
+        :param str ac: Accession
+        :return: Chromosome, warning
+        """
+        chromosome = self._ac_to_chromosome_cache.get(ac)
+        if chromosome is None:
+            chromosome, warning = self._ac_to_chromosome(ac)
+            if not chromosome:
+                return chromosome, warning
+            _cache_translation(self._ac_to_chromosome_cache, ac, chromosome)
+        return chromosome, None
+
+    def _ac_to_chromosome(self, ac: str) -> tuple[str | None, str | None]:
+        """Look up chromosome for accession in SeqRepo
+
         :param str ac: Accession
         :return: Chromosome, warning
         """
         aliases, _ = self.translate_alias(ac)
-        aliases = (
-            [
-                a.split(":")[-1]
-                for a in aliases
-                if a.startswith("GRCh") and "." not in a and "chr" not in a
-            ]
-            or [None]
-        )[0]
-        if aliases is None:
-            return None, f"Unable to get chromosome for {ac}"
-        return aliases, None
+        for alias in aliases:
+            if alias.startswith("GRCh") and "." not in alias and "chr" not in alias:
+                return alias.split(":")[-1], None
+        return None, f"Unable to get chromosome for {ac}"
 
     def get_fasta_file(self, sequence_id: str, outfile_path: Path) -> None:
         """Retrieve FASTA file containing sequence for requested sequence ID.
@@ -197,29 +269,10 @@ class SeqRepoAccess(SeqRepoDataProxy):
         if not sequence:
             raise KeyError
 
-        refseq_prefixes = [
-            "NC_",
-            "AC_",
-            "NZ_",
-            "NT_",
-            "NW_",
-            "NG_",
-            "NM_",
-            "XM_",
-            "NR_",
-            "XR_",
-            "NP_",
-            "AP_",
-            "XP_",
-            "YP_",
-            "WP_",
-        ]
-        ensembl_prefixes = ["ENSE", "ENSFM", "ENSG", "ENSGT", "ENSP", "ENSR", "ENST"]
-
-        if sequence_id[:3] in refseq_prefixes:
+        if sequence_id.startswith(_REFSEQ_PREFIXES):
             aliases = self.translate_identifier(sequence_id, ["ensembl", "ga4gh"])
             header = f">refseq:{sequence_id}|{'|'.join(aliases[0])}"
-        elif sequence_id[:4] in ensembl_prefixes:
+        elif sequence_id.startswith(_ENSEMBL_PREFIXES):
             aliases = self.translate_identifier(sequence_id, ["refseq", "ga4gh"])
             header = f">ensembl:{sequence_id}|{'|'.join(aliases[0])}"
         else:
@@ -168,11 +168,11 @@ class AlignmentMapper:
             # Validate that genomic accession assembly == target_genome_assembly
             aliases, _ = self.seqrepo_access.translate_identifier(alt_ac)
             if aliases:
-                grch_aliases = [a for a in aliases if a.startswith("GRCh")]
-                if not grch_aliases:
+                grch_alias = next((a for a in aliases if a.startswith("GRCh")), None)
+                if not grch_alias:
                     warning = f"Unable to find associated assembly for {alt_ac}"
                 else:
-                    found_assembly = grch_aliases[0].split(":")[0]
+                    found_assembly = grch_alias.split(":")[0]
                     if found_assembly != target_genome_assembly:
                         warning = (
                             f"{alt_ac} uses {found_assembly} assembly which "
@@ -648,43 +648,37 @@ class ManeTranscript:
         :return: List of prioritized transcripts for a given gene. Sort by latest
             assembly, longest length of transcript, with first-published transcripts
             breaking ties. If there are multiple transcripts for a given accession, the
-            most recent version of a transcript associated with an assembly will be kept
+            most recent version of a transcript associated with an assembly will be kept.
+            Only RefSeq ``NM_`` transcripts are prioritized.
         """
-        copy_df = df.clone()
-        copy_df = copy_df.drop("alt_ac").unique()
-        copy_df = copy_df.with_columns(
+        df = df.drop("alt_ac").unique().filter(pl.col("tx_ac").str.starts_with("NM_"))
+        df = df.with_columns(
             [
                 pl.col("tx_ac")
-                .str.split(".")
-                .list.get(0)
-                .str.split("NM_")
-                .list.get(1)
+                .str.extract(r"^NM_(\d+)\.", 1)
                 .cast(pl.Int64)
                 .alias("ac_no_version_as_int"),
                 pl.col("tx_ac")
-                .str.split(".")
-                .list.get(1)
+                .str.extract(r"\.(\d+)$", 1)
                 .cast(pl.Int16)
                 .alias("ac_version"),
             ]
         )
-        copy_df = copy_df.sort(
-            by=["ac_no_version_as_int", "ac_version"], descending=[True, True]
-        )
-        copy_df = copy_df.unique(["ac_no_version_as_int"], keep="first")
-
-        copy_df = copy_df.with_columns(
-            copy_df.map_rows(
-                lambda x: len(self.seqrepo_access.get_reference_sequence(x[1])[0])
+        df = df.sort(by=["ac_no_version_as_int", "ac_version"], descending=[True, True])
+        df = df.unique(["ac_no_version_as_int"], keep="first")
+
+        df = df.with_columns(
+            pl.Series(
+                "len_of_tx",
+                [
+                    len(self.seqrepo_access.get_reference_sequence(tx_ac)[0])
+                    for tx_ac in df["tx_ac"]
+                ],
             )
-            .to_series()
-            .alias("len_of_tx")
         )
 
-        copy_df = copy_df.sort(
-            by=["len_of_tx", "ac_no_version_as_int"], descending=[True, False]
-        )
-        return copy_df.select("tx_ac").to_series().to_list()
+        df = df.sort(by=["len_of_tx", "ac_no_version_as_int"], descending=[True, False])
+        return df.select("tx_ac").to_series().to_list()
 
     async def get_longest_compatible_transcript(
         self,
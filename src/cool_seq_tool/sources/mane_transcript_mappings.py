@@ -2,7 +2,10 @@
 MANE transcripts for gene symbols, genomic positions, or transcript accessions.
 """
 
+import contextlib
+import glob
 import logging
+import tempfile
 from pathlib import Path
 
 import polars as pl
@@ -12,6 +15,19 @@ from cool_seq_tool.schemas import ManeGeneData
 
 _logger = logging.getLogger(__name__)
 
+# chromosome and strand only take a handful of distinct values, and chromosome
+# coordinates fit in 32 bits
+_MANE_SCHEMA_OVERRIDES = {
+    "GRCh38_chr": pl.Categorical,
+    "chr_start": pl.Int32,
+    "chr_end": pl.Int32,
+    "chr_strand": pl.Categorical,
+}
+
+# Bump whenever parsing settings change, so caches written by older versions are
+# not reused
+_MANE_CACHE_VERSION = 1
+
 
 class ManeTranscriptMappings:
     """Provide fast tabular access to MANE summary file.
@@ -38,12 +54,130 @@ class ManeTranscriptMappings:
         self.mane_data_path = mane_data_path
         self.df = self._load_mane_transcript_data()
 
+    @property
+    def df(self) -> pl.DataFrame:
+        """Provide MANE summary data.
+
+        :return: DataFrame containing RefSeq MANE Transcript data
+        """
+        return self._df
+
+    @df.setter
+    def df(self, df: pl.DataFrame) -> None:
+        """Set MANE summary data, and rebuild the lookup state derived from it.
+
+        :param df: DataFrame containing RefSeq MANE Transcript data
+        """
+        self._df = df
+        self._chr_dfs = self._partition_by_chromosome()
+        # case-normalized once so gene lookups don't transform every row per query
+        self._symbols_upper = df["symbol"].str.to_uppercase()
+
+    @df.deleter
+    def df(self) -> None:
+        """Delete MANE summary data, along with the lookup state derived from it."""
+        del self._df, self._chr_dfs, self._symbols_upper
+
     def _load_mane_transcript_data(self) -> pl.DataFrame:
         """Load RefSeq MANE data file into DataFrame.
 
+        The parsed table is cached as a Parquet file alongside the MANE summary file,
+        and reused on subsequent loads for as long as it is newer than the summary
+        file. An unreadable cache is ignored and rewritten, and caches left behind for
+        other MANE summary versions or by older cache formats are removed. If the cache
+        can't be written (e.g. a read-only data directory), the summary file is parsed
+        on every load.
+
         :return: DataFrame containing RefSeq MANE Transcript data
         """
-        return pl.read_csv(self.mane_data_path, separator="\t")
+        cache_path = self.mane_data_path.with_suffix(f".v{_MANE_CACHE_VERSION}.parquet")
+        if (
+            cache_path.exists()
+            and cache_path.stat().st_mtime >= self.mane_data_path.stat().st_mtime
+        ):
+            _logger.debug("Loading cached MANE data from %s", cache_path)
+            try:
+                return pl.read_parquet(cache_path)
+            except (OSError, pl.exceptions.PolarsError) as e:
+                _logger.warning(
+                    "Unable to load cached MANE data from %s, re-parsing %s: %s",
+                    cache_path,
+                    self.mane_data_path,
+                    e,
+                )
+
+        df = pl.read_csv(
+            self.mane_data_path,
+            separator="\t",
+            schema_overrides=_MANE_SCHEMA_OVERRIDES,
+        )
+        # write to a uniquely named file and move it into place, so that concurrent
+        # loaders never read or write a partially written cache
+        tmp_cache_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent,
+                prefix=f"{cache_path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as tmp_file:
+                tmp_cache_path = Path(tmp_file.name)
+                df.write_parquet(tmp_file)
+            tmp_cache_path.replace(cache_path)
+        except (OSError, pl.exceptions.PolarsError) as e:
+            # caching is only an optimization, and read-only data directories are
+            # expected, so this isn't worth a warning on every startup
+            _logger.debug("Unable to cache MANE data to %s: %s", cache_path, e)
+            if tmp_cache_path:
+                tmp_cache_path.unlink(missing_ok=True)
+        else:
+            self._remove_stale_caches(cache_path)
+        return df
+
+    def _remove_stale_caches(self, cache_path: Path) -> None:
+        """Remove Parquet caches of other MANE summary versions, and caches of this
+        summary file written in older cache formats.
+
+        :param cache_path: Path to current cache, which is kept
+        """
+        stale_cache_paths = {
+            *cache_path.parent.glob("ncbi_mane_summary_*.parquet"),
+            *cache_path.parent.glob(
+                f"{glob.escape(self.mane_data_path.stem)}.*parquet"
+            ),
+        } - {cache_path}
+        for stale_cache_path in stale_cache_paths:
+            _logger.debug("Removing stale MANE cache %s", stale_cache_path)
+            # best effort, since stale caches are never read
+            with contextlib.suppress(OSError):
+                stale_cache_path.unlink(missing_ok=True)
+
+    def _partition_by_chromosome(self) -> dict[str, pl.DataFrame]:
+        """Split MANE data into per-chromosome DataFrames, so that genomic position
+        lookups only need to scan rows on the queried chromosome.
+
+        :return: Mapping from GRCh38 RefSeq chromosome accession to MANE data
+        """
+        return {
+            key[0]: chr_df
+            for key, chr_df in self.df.partition_by("GRCh38_chr", as_dict=True).items()
+        }
+
+    def _get_chr_pos_rows(self, alt_ac: str, start: int, end: int) -> pl.DataFrame:
+        """Get MANE rows whose genomic region contains the given position.
+
+        :param alt_ac: GRCh38 RefSeq chromosome accession
+        :param start: Start genomic position. Assumes residue coordinates.
+        :param end: End genomic position. Assumes residue coordinates.
+        :return: MANE rows on ``alt_ac`` that contain the position. Empty if
+            ``alt_ac`` has no MANE data.
+        """
+        chr_df = self._chr_dfs.get(alt_ac)
+        if chr_df is None:
+            return self.df.clear()
+        return chr_df.filter(
+            (start >= pl.col("chr_start")) & (end <= pl.col("chr_end"))
+        )
 
     def get_gene_mane_data(self, gene_symbol: str) -> list[dict]:
         """Return MANE Transcript data for a gene.
@@ -61,9 +195,7 @@ class ManeTranscriptMappings:
             location information). The list is sorted so that a MANE Select entry comes
             first, followed by a MANE Plus Clinical entry, if available.
         """
-        data = self.df.filter(
-            pl.col("symbol").str.to_uppercase() == gene_symbol.upper()
-        )
+        data = self.df.filter(self._symbols_upper == gene_symbol.upper())
 
         if len(data) == 0:
             _logger.warning(
@@ -96,11 +228,7 @@ class ManeTranscriptMappings:
         :return: List of MANE data. Will return sorted list:
             MANE Select then MANE Plus Clinical.
         """
-        mane_rows = self.df.filter(
-            (start >= pl.col("chr_start"))
-            & (end <= pl.col("chr_end"))
-            & (pl.col("GRCh38_chr") == alt_ac)
-        )
+        mane_rows = self._get_chr_pos_rows(alt_ac, start, end)
         if len(mane_rows) == 0:
             return []
 
@@ -118,57 +246,45 @@ class ManeTranscriptMappings:
         :return: Unique MANE gene(s) found for a genomic location
         """
         # Only interested in rows where genomic location lives
-        mane_rows = self.df.filter(
-            (start >= pl.col("chr_start"))
-            & (end <= pl.col("chr_end"))
-            & (pl.col("GRCh38_chr") == ac)
-        )
+        mane_rows = self._get_chr_pos_rows(ac, start, end)
 
         if mane_rows.is_empty():
             return []
 
-        # Group rows by NCBI ID, transform values to representation we want, MANE status
-        # will be converted to list with DESC order
-        mane_rows = mane_rows.group_by("#NCBI_GeneID").agg(
-            [
-                pl.col("#NCBI_GeneID")
-                .first()
-                .str.split_exact(":", 1)
-                .struct.field("field_1")
-                .cast(pl.Int32)
-                .alias("ncbi_gene_id"),
-                pl.col("HGNC_ID")
-                .first()
-                .str.split_exact(":", 1)
-                .struct.field("field_1")
-                .cast(pl.Int32)
-                .alias("hgnc_id"),
-                pl.col("MANE_status")
-                .unique()
-                .str.to_lowercase()
-                .str.replace_all(" ", "_")
-                .alias("status")
-                .sort(descending=True),
-                pl.col("symbol").first(),
-            ]
-        )
+        # Group rows by NCBI ID, transform values to representation we want. Only a
+        # handful of rows match a location, so a single pass is cheaper than a polars
+        # group_by/sort pipeline
+        mane_genes: dict[str, dict] = {}
+        for ncbi_gene_id, hgnc_id, symbol, mane_status in mane_rows.select(
+            "#NCBI_GeneID", "HGNC_ID", "symbol", "MANE_status"
+        ).iter_rows():
+            mane_gene = mane_genes.setdefault(
+                ncbi_gene_id,
+                {
+                    "ncbi_gene_id": int(ncbi_gene_id.split(":")[1]),
+                    "hgnc_id": int(hgnc_id.split(":")[1]) if hgnc_id else None,
+                    "symbol": symbol,
+                    "status": set(),
+                },
+            )
+            mane_gene["status"].add(mane_status.lower().replace(" ", "_"))
+
+        # MANE status will be converted to list with DESC order
+        for mane_gene in mane_genes.values():
+            mane_gene["status"] = sorted(mane_gene["status"], reverse=True)
 
         # Sort final rows based on MANE status
         # First by length (which means gene has both select and plus clinical)
         # Then by DESC order
         # Then by NCBI ID ASC order
-        mane_rows = (
-            mane_rows.with_columns(
-                [
-                    pl.col("status").list.len().alias("status_count"),
-                    pl.col("status").list.join("_").alias("status_str"),
-                    pl.col("ncbi_gene_id"),
-                ]
-            )
-            .sort(
-                ["status_count", "status_str", "ncbi_gene_id"],
-                descending=[True, True, False],
-            )
-            .drop(["status_count", "status_str", "#NCBI_GeneID"])
+        sorted_mane_genes = sorted(
+            mane_genes.values(), key=lambda mane_gene: mane_gene["ncbi_gene_id"]
+        )
+        sorted_mane_genes.sort(
+            key=lambda mane_gene: (
+                len(mane_gene["status"]),
+                "_".join(mane_gene["status"]),
+            ),
+            reverse=True,
         )
-        return [ManeGeneData(**mane_gene) for mane_gene in mane_rows.to_dicts()]
+        return [ManeGeneData(**mane_gene) for mane_gene in sorted_mane_genes]
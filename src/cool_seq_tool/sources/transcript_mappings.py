@@ -1,8 +1,9 @@
 """Provide mappings between gene symbols and RefSeq + Ensembl transcript accessions."""
 
-import csv
 from pathlib import Path
 
+import polars as pl
+
 from cool_seq_tool.resources.data_files import DataFile, get_data_file
 
 
@@ -74,74 +75,80 @@ class TranscriptMappings:
 
         :param transcript_file_path: Path to transcript mappings file
         """
-        with transcript_file_path.open() as file:
-            reader = csv.DictReader(file, delimiter="\t")
-            for row in reader:
-                gene = row["Gene name"]
-                if gene:
-                    versioned_protein_transcript = row["Protein stable ID version"]
-                    if versioned_protein_transcript:
-                        self.ensembl_protein_version_for_gene_symbol.setdefault(
-                            gene, []
-                        ).append(versioned_protein_transcript)
-                        self.ensembl_protein_version_to_gene_symbol[
-                            versioned_protein_transcript
-                        ] = gene
-                    protein_transcript = row["Protein stable ID"]
-                    if protein_transcript:
-                        self.ensembl_protein_for_gene_symbol.setdefault(
-                            gene, []
-                        ).append(protein_transcript)
-                        self.ensembl_protein_to_gene_symbol[protein_transcript] = gene
-                    versioned_transcript = row["Transcript stable ID version"]
-                    if versioned_transcript:
-                        self.ensembl_transcript_version_for_gene_symbol.setdefault(
-                            gene, []
-                        ).append(versioned_transcript)
-                        self.ensembl_transcript_version_to_gene_symbol[
-                            versioned_transcript
-                        ] = gene
-                    transcript = row["Transcript stable ID"]
-                    if transcript:
-                        self.ensembl_transcript_for_gene_symbol.setdefault(
-                            gene, []
-                        ).append(transcript)
-                        self.ensembl_transcript_to_gene_symbol[transcript] = gene
-                    if versioned_transcript and versioned_protein_transcript:
-                        self.ensp_to_enst[versioned_protein_transcript] = (
-                            versioned_transcript
-                        )
+        df = (
+            pl.scan_csv(transcript_file_path, separator="\t", infer_schema=False)
+            .select(
+                "Gene name",
+                "Protein stable ID version",
+                "Protein stable ID",
+                "Transcript stable ID version",
+                "Transcript stable ID",
+            )
+            .filter(pl.col("Gene name").is_not_null())
+            .collect()
+        )
+        for (
+            gene,
+            versioned_protein_transcript,
+            protein_transcript,
+            versioned_transcript,
+            transcript,
+        ) in df.iter_rows():
+            if versioned_protein_transcript:
+                self.ensembl_protein_version_for_gene_symbol.setdefault(
+                    gene, []
+                ).append(versioned_protein_transcript)
+                self.ensembl_protein_version_to_gene_symbol[
+                    versioned_protein_transcript
+                ] = gene
+            if protein_transcript:
+                self.ensembl_protein_for_gene_symbol.setdefault(gene, []).append(
+                    protein_transcript
+                )
+                self.ensembl_protein_to_gene_symbol[protein_transcript] = gene
+            if versioned_transcript:
+                self.ensembl_transcript_version_for_gene_symbol.setdefault(
+                    gene, []
+                ).append(versioned_transcript)
+                self.ensembl_transcript_version_to_gene_symbol[versioned_transcript] = (
+                    gene
+                )
+            if transcript:
+                self.ensembl_transcript_for_gene_symbol.setdefault(gene, []).append(
+                    transcript
+                )
+                self.ensembl_transcript_to_gene_symbol[transcript] = gene
+            if versioned_transcript and versioned_protein_transcript:
+                self.ensp_to_enst[versioned_protein_transcript] = versioned_transcript
 
     def _load_refseq_gene_symbol_data(self, lrg_refseqgene_path: Path) -> None:
         """Load data from RefSeq Gene Symbol file to dictionaries.
 
         :param Path lrg_refseqgene_path: Path to LRG RefSeqGene file
         """
-        with lrg_refseqgene_path.open() as file:
-            reader = csv.DictReader(file, delimiter="\t")
-            for row in reader:
-                gene = row["Symbol"]
-                if gene:
-                    refseq_transcript = row["Protein"]
-                    if refseq_transcript:
-                        self.refseq_protein_for_gene_symbol.setdefault(gene, []).append(
-                            refseq_transcript
-                        )
-                        self.refseq_protein_to_gene_symbol[refseq_transcript] = gene
-                    rna_transcript = row["RNA"]
-                    if rna_transcript:
-                        self.refseq_rna_version_for_gene_symbol.setdefault(
-                            gene, []
-                        ).append(rna_transcript)
-                        self.refseq_rna_version_to_gene_symbol[rna_transcript] = gene
-                        if "." in rna_transcript:
-                            rna_t = rna_transcript.split(".")[0]
-                            self.refseq_rna_for_gene_symbol.setdefault(gene, []).append(
-                                rna_t
-                            )
-                            self.refseq_rna_to_gene_symbol[rna_t] = gene
-                    if refseq_transcript and rna_transcript:
-                        self.np_to_nm[refseq_transcript] = rna_transcript
+        df = (
+            pl.scan_csv(lrg_refseqgene_path, separator="\t", infer_schema=False)
+            .select("Symbol", "Protein", "RNA")
+            .filter(pl.col("Symbol").is_not_null())
+            .collect()
+        )
+        for gene, refseq_transcript, rna_transcript in df.iter_rows():
+            if refseq_transcript:
+                self.refseq_protein_for_gene_symbol.setdefault(gene, []).append(
+                    refseq_transcript
+                )
+                self.refseq_protein_to_gene_symbol[refseq_transcript] = gene
+            if rna_transcript:
+                self.refseq_rna_version_for_gene_symbol.setdefault(gene, []).append(
+                    rna_transcript
+                )
+                self.refseq_rna_version_to_gene_symbol[rna_transcript] = gene
+                if "." in rna_transcript:
+                    rna_t = rna_transcript.split(".")[0]
+                    self.refseq_rna_for_gene_symbol.setdefault(gene, []).append(rna_t)
+                    self.refseq_rna_to_gene_symbol[rna_t] = gene
+            if refseq_transcript and rna_transcript:
+                self.np_to_nm[refseq_transcript] = rna_transcript
 
     def protein_transcripts(self, identifier: str) -> list[str]:
         """Return a list of protein transcripts for a gene symbol.
@@ -1,5 +1,7 @@
 """Module for testing seqrepo access class"""
 
+from unittest.mock import patch
+
 import pytest
 
 from cool_seq_tool.schemas import CoordinateType
@@ -130,6 +132,23 @@ def test_chromosome_to_acs(test_seqrepo_access):
     resp = test_seqrepo_access.chromosome_to_acs("117")
     assert resp == (None, 'Unable to find matching accessions for "117" in SeqRepo.')
 
+    # Repeated lookups should be served from cache
+    with patch.object(test_seqrepo_access, "translate_identifier") as mock_translate:
+        resp = test_seqrepo_access.chromosome_to_acs("7")
+        assert resp == (["NC_000007.14", "NC_000007.13"], None)
+        mock_translate.assert_not_called()
+
+    # Failed lookups aren't cached
+    with patch.object(
+        test_seqrepo_access, "translate_identifier", return_value=([], None)
+    ) as mock_translate:
+        resp = test_seqrepo_access.chromosome_to_acs("117")
+        assert resp == (
+            None,
+            'Unable to find matching accessions for "117" in SeqRepo.',
+        )
+        mock_translate.assert_called()
+
 
 def test_ac_to_chromosome(test_seqrepo_access):
     """Test that ac_to_chromosome method works correctly"""
@@ -139,6 +158,32 @@ def test_ac_to_chromosome(test_seqrepo_access):
     resp = test_seqrepo_access.ac_to_chromosome("NC_000007.1323")
     assert resp == (None, "Unable to get chromosome for NC_000007.1323")
 
+    # Repeated lookups should be served from cache
+    with patch.object(test_seqrepo_access, "translate_alias") as mock_translate:
+        resp = test_seqrepo_access.ac_to_chromosome("NC_000007.13")
+        assert resp == ("7", None)
+        mock_translate.assert_not_called()
+
+    # Failed lookups aren't cached
+    with patch.object(
+        test_seqrepo_access, "translate_alias", return_value=([], None)
+    ) as mock_translate:
+        resp = test_seqrepo_access.ac_to_chromosome("NC_000007.1323")
+        assert resp == (None, "Unable to get chromosome for NC_000007.1323")
+        mock_translate.assert_called_once()
+
+    # Cache is bounded, evicting the oldest translations first
+    with patch.object(
+        test_seqrepo_access, "translate_alias", return_value=(["GRCh38:7"], None)
+    ) as mock_translate:
+        for i in range(257):
+            test_seqrepo_access.ac_to_chromosome(f"NC_999999.{i}")
+        assert mock_translate.call_count == 257
+        test_seqrepo_access.ac_to_chromosome("NC_999999.256")
+        assert mock_translate.call_count == 257
+        test_seqrepo_access.ac_to_chromosome("NC_999999.0")
+        assert mock_translate.call_count == 258
+
 
 def test_get_fasta_file(test_seqrepo_access, tmp_path):
     """Test get_fasta_file method"""
@@ -494,6 +494,9 @@ def test_get_prioritized_transcripts_from_gene(
             ["NP_004324.2", "NM_004333.5", "NC_000007.14", 0],
             ["NP_001365401.1", "NM_001378472.1", "NC_000007.14", 0],
             ["NP_001365401.1", "NM_001374258.2", "NC_000007.14", 0],
+            # Only NM_ transcripts are prioritized
+            ["ENSP00000493543.1", "ENST00000646891.2", "NC_000007.14", 0],
+            ["ENSP00000496776.1", "ENST00000644969.2", "NC_000007.14", 0],
         ]
         test_df = pl.DataFrame(
             data, schema=["pro_ac", "tx_ac", "alt_ac", "cds_start_i"], orient="row"
@@ -1,11 +1,13 @@
 """Module for testing MANE Transcript Mapping class."""
 
+import logging
 from unittest.mock import patch
 
 import polars as pl
 import pytest
 
 from cool_seq_tool.schemas import ManeGeneData
+from cool_seq_tool.sources.mane_transcript_mappings import ManeTranscriptMappings
 
 
 @pytest.fixture(scope="module")
@@ -92,6 +94,73 @@ def ercc6_select():
     }
 
 
+def test_load_mane_transcript_data_cache(braf_select, braf_plus_clinical, tmp_path):
+    """Test that parsed MANE data is cached and reused"""
+    mane_data_path = tmp_path / "ncbi_mane_summary_1.3.txt"
+    pl.DataFrame([braf_select, braf_plus_clinical]).write_csv(
+        mane_data_path, separator="\t"
+    )
+    # Caches of other MANE versions and older cache formats are removed
+    stale_cache_paths = [
+        tmp_path / "ncbi_mane_summary_1.2.v1.parquet",
+        tmp_path / "ncbi_mane_summary_1.3.parquet",
+    ]
+    for stale_cache_path in stale_cache_paths:
+        stale_cache_path.write_bytes(b"stale")
+
+    mane_mappings = ManeTranscriptMappings(mane_data_path)
+    cache_paths = list(tmp_path.glob("*.parquet"))
+    assert len(cache_paths) == 1
+    assert cache_paths[0] not in stale_cache_paths
+    assert not list(tmp_path.glob("*.tmp"))
+
+    cached_mane_mappings = ManeTranscriptMappings(mane_data_path)
+    assert cached_mane_mappings.df.equals(mane_mappings.df)
+    assert cached_mane_mappings.get_gene_mane_data("BRAF") == [
+        braf_select,
+        braf_plus_clinical,
+    ]
+
+    # Unreadable cache is ignored and rewritten
+    cache_paths[0].write_bytes(b"not parquet")
+    recovered_mane_mappings = ManeTranscriptMappings(mane_data_path)
+    assert recovered_mane_mappings.df.equals(mane_mappings.df)
+    assert pl.read_parquet(cache_paths[0]).equals(mane_mappings.df)
+
+
+def test_load_mane_transcript_data_cache_unwritable(braf_select, tmp_path, caplog):
+    """Test that failing to write the cache doesn't log a warning"""
+    mane_data_path = tmp_path / "ncbi_mane_summary_1.3.txt"
+    pl.DataFrame([braf_select]).write_csv(mane_data_path, separator="\t")
+
+    with patch(
+        "cool_seq_tool.sources.mane_transcript_mappings.tempfile.NamedTemporaryFile",
+        side_effect=PermissionError("Read-only file system"),
+    ):
+        mane_mappings = ManeTranscriptMappings(mane_data_path)
+    assert mane_mappings.get_gene_mane_data("BRAF") == [braf_select]
+    assert not list(tmp_path.glob("*.parquet"))
+    assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+
+
+def test_set_df(braf_select, ercc6_select, tmp_path):
+    """Test that replacing MANE data also updates gene and position lookups"""
+    mane_data_path = tmp_path / "ncbi_mane_summary_1.3.txt"
+    pl.DataFrame([braf_select]).write_csv(mane_data_path, separator="\t")
+    mane_mappings = ManeTranscriptMappings(mane_data_path)
+
+    mane_mappings.df = pl.DataFrame([ercc6_select])
+    assert mane_mappings.get_gene_mane_data("braf") == []
+    assert mane_mappings.get_gene_mane_data("ercc6") == [ercc6_select]
+    assert mane_mappings.get_mane_data_from_chr_pos(
+        "NC_000010.11", 49454470, 49454470
+    ) == [ercc6_select]
+    assert (
+        mane_mappings.get_mane_data_from_chr_pos("NC_000007.14", 140753336, 140753336)
+        == []
+    )
+
+
 def test_get_gene_mane_data(
     test_mane_transcript_mappings,
     braf_select,
@@ -0,0 +1,118 @@
+"""Module for testing CoolSeqTool resource construction"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from cool_seq_tool import CoolSeqTool
+
+
+def test_resources_loaded_on_first_access(tmp_path):
+    """Test that resources aren't loaded until first accessed"""
+    with (
+        patch("cool_seq_tool.app.SeqRepo") as mock_seqrepo,
+        patch("cool_seq_tool.app.TranscriptMappings") as mock_transcript_mappings,
+        patch("cool_seq_tool.app.UtaDatabase") as mock_uta_db,
+        patch("cool_seq_tool.app.LiftOver") as mock_liftover,
+    ):
+        cst = CoolSeqTool(
+            mane_data_path=tmp_path / "ncbi_mane_summary_1.3.txt",
+            force_local_files=True,
+        )
+        for mock in (
+            mock_seqrepo,
+            mock_transcript_mappings,
+            mock_uta_db,
+            mock_liftover,
+        ):
+            mock.assert_not_called()
+
+        assert cst.uta_db is cst.uta_db
+        mock_uta_db.assert_called_once()
+        mock_transcript_mappings.assert_not_called()
+
+    # Missing data is only reported once the resource is accessed
+    with pytest.raises(FileNotFoundError):
+        cst.mane_transcript_mappings  # noqa: B018
+
+
+def test_concurrent_first_access():
+    """Test that concurrent first accesses share a single resource instance"""
+
+    def load_uta_db(**_kwargs: str) -> object:
+        time.sleep(0.05)
+        return object()
+
+    with patch("cool_seq_tool.app.UtaDatabase", side_effect=load_uta_db) as mock:
+        cst = CoolSeqTool()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            resources = list(executor.map(lambda _: cst.uta_db, range(8)))
+
+    mock.assert_called_once()
+    assert all(resource is resources[0] for resource in resources)
+
+
+def test_mapper_data_sources_loaded_concurrently():
+    """Test that a mapper's data sources are loaded in parallel on first access"""
+    barrier = threading.Barrier(4, timeout=5)
+
+    def load_data_source(*_args: str, **_kwargs: str) -> object:
+        # only passes if all four data sources are loading at the same time
+        barrier.wait()
+        return object()
+
+    with (
+        patch("cool_seq_tool.app.SeqRepo"),
+        patch("cool_seq_tool.app.SeqRepoAccess"),
+        patch("cool_seq_tool.app.TranscriptMappings", side_effect=load_data_source),
+        patch("cool_seq_tool.app.ManeTranscriptMappings", side_effect=load_data_source),
+        patch("cool_seq_tool.app.UtaDatabase", side_effect=load_data_source),
+        patch("cool_seq_tool.app.LiftOver", side_effect=load_data_source),
+        patch("cool_seq_tool.app.ManeTranscript") as mock_mane_transcript,
+    ):
+        cst = CoolSeqTool()
+        assert cst.mane_transcript is mock_mane_transcript.return_value
+        mock_mane_transcript.assert_called_once_with(
+            cst.seqrepo_access,
+            cst.transcript_mappings,
+            cst.mane_transcript_mappings,
+            cst.uta_db,
+            cst.liftover,
+        )
+
+
+def test_override_resources():
+    """Test that resources can be assigned and patched"""
+    with (
+        patch("cool_seq_tool.app.SeqRepo"),
+        patch("cool_seq_tool.app.TranscriptMappings"),
+        patch("cool_seq_tool.app.UtaDatabase") as mock_uta_db,
+        patch("cool_seq_tool.app.LiftOver") as mock_liftover,
+        patch("cool_seq_tool.app.AlignmentMapper") as mock_alignment_mapper,
+    ):
+        cst = CoolSeqTool()
+
+        # Assigned resources are used in place of loading them
+        uta_db = object()
+        cst.uta_db = uta_db
+        assert cst.uta_db is uta_db
+        cst.alignment_mapper  # noqa: B018
+        assert mock_alignment_mapper.call_args.args[2] is uta_db
+        mock_uta_db.assert_not_called()
+
+        # Deleting an override falls back to the loaded resource
+        del cst.uta_db
+        assert cst.uta_db is mock_uta_db.return_value
+
+        # Patched resources are restored afterwards, whether loaded yet or not
+        with patch.object(cst, "uta_db") as patched_uta_db:
+            assert cst.uta_db is patched_uta_db
+        assert cst.uta_db is mock_uta_db.return_value
+        with patch.object(cst, "liftover") as patched_liftover:
+            assert cst.liftover is patched_liftover
+        assert cst.liftover is mock_liftover.return_value
+        mock_uta_db.assert_called_once()
+        mock_liftover.assert_called_once()